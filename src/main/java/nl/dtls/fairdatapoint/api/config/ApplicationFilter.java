@@ -49,17 +49,19 @@ import org.springframework.web.filter.OncePerRequestFilter;
 @Component
 public class ApplicationFilter extends OncePerRequestFilter {
 
+    private static final String ALLOWED_METHODS
+            = (RequestMethod.GET.name() + "," + RequestMethod.POST.name()
+            + "," + RequestMethod.PATCH.name());
+
     @Override
     public void doFilterInternal(final HttpServletRequest request,
             final HttpServletResponse response, final FilterChain fc)
             throws IOException, ServletException {
-        String allowedMtds = (RequestMethod.GET.name() + "," + 
-                RequestMethod.POST.name() + "," + RequestMethod.PATCH.name());
         response.setHeader(HttpHeaders.SERVER, "FAIR data point (JAVA)");
         response.setHeader(HttpHeaders.ACCESS_CONTROL_ALLOW_ORIGIN, "*");
         response.setHeader(HttpHeaders.ACCESS_CONTROL_ALLOW_HEADERS, 
                 HttpHeaders.CONTENT_TYPE);
-        response.setHeader(HttpHeaders.ALLOW, allowedMtds);
+        response.setHeader(HttpHeaders.ALLOW, ALLOWED_METHODS);
         response.setHeader(HttpHeaders.ACCESS_CONTROL_ALLOW_METHODS,
                 (HttpHeaders.ACCEPT));
         ThreadContext.put("ipAddress", request.getRemoteAddr());
@@ -23,7 +23,9 @@
 package nl.dtls.fairdatapoint.api.config;
 
 import java.io.IOException;
+import java.util.HashSet;
 import java.util.List;
+import java.util.Set;
 
 import org.apache.logging.log4j.LogManager;
 import org.apache.logging.log4j.Logger;
@@ -32,6 +34,7 @@ import org.eclipse.rdf4j.repository.Repository;
 import org.eclipse.rdf4j.repository.RepositoryException;
 import org.eclipse.rdf4j.repository.sail.SailRepository;
 import org.eclipse.rdf4j.repository.sparql.SPARQLRepository;
+import org.eclipse.rdf4j.rio.RDFFormat;
 import org.eclipse.rdf4j.sail.Sail;
 import org.eclipse.rdf4j.sail.memory.MemoryStore;
 import org.springframework.beans.factory.annotation.Autowired;
@@ -90,8 +93,13 @@ public class RestApiContext extends WebMvcConfigurerAdapter {
 
     @Override
     public void configureContentNegotiation(ContentNegotiationConfigurer configurer) {
+        // one converter bean exists per (metadata type, format) pair, so
+        // register each format's media type only once
+        Set<RDFFormat> registeredFormats = new HashSet<>();
         for (AbstractMetadataMessageConverter<?> converter : metadataConverters) {
-            converter.configureContentNegotiation(configurer);
+            if (registeredFormats.add(converter.getFormat())) {
+                converter.configureContentNegotiation(configurer);
+            }
         }
     }
 
@@ -99,10 +107,10 @@ public class RestApiContext extends WebMvcConfigurerAdapter {
             destroyMethod = "shutDown")
     public Repository repository(Environment env)
             throws RepositoryException {
-        String storeURL = env.getProperty("store-url");
-        int storeType = env.getProperty("store-type", Integer.class);
+        int storeType = env.getProperty("store-type", Integer.class, 1);
         Repository repository;
         if (storeType == 2) {
+            String storeURL = env.getProperty("store-url");
             repository = new SPARQLRepository(storeURL);
             LOGGER.info("HTTP triple store initialize");
         } else { // In memory is the default store
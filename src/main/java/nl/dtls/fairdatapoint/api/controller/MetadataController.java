@@ -27,8 +27,8 @@
  */
 package nl.dtls.fairdatapoint.api.controller;
 
-import java.net.MalformedURLException;
-import java.net.URL;
+import java.net.URI;
+import java.net.URISyntaxException;
 
 import javax.servlet.http.HttpServletRequest;
 import javax.servlet.http.HttpServletResponse;
@@ -63,6 +63,7 @@ import nl.dtl.fairmetadata4j.model.DatasetMetadata;
 import nl.dtl.fairmetadata4j.model.DistributionMetadata;
 import nl.dtl.fairmetadata4j.model.FDPMetadata;
 import nl.dtl.fairmetadata4j.model.Identifier;
+import nl.dtl.fairmetadata4j.model.Metadata;
 import nl.dtl.fairmetadata4j.utils.MetadataUtils;
 import nl.dtl.fairmetadata4j.utils.vocabulary.DataCite;
 import nl.dtls.fairdatapoint.api.controller.utils.LoggerUtils;
@@ -117,11 +118,9 @@ public class MetadataController {
             ResourceNotFoundException,
             MetadataException {
         LOGGER.info("Request to get FDP metadata");
-        LOGGER.info("GET : " + request.getRequestURL());
         String uri = getRequesedURL(request);
-        if (!isFDPMetaDataAvailable) {
-            storeDefaultFDPMetadata(request);
-        }
+        LOGGER.info("GET : {}", uri);
+        ensureDefaultFDPMetadata(request);
         FDPMetadata metadata = fairMetaDataService.retrieveFDPMetaData(
                 valueFactory.createIRI(uri));
         LoggerUtils.logRequest(LOGGER, request, response);
@@ -134,19 +133,13 @@ public class MetadataController {
     public ModelAndView getHtmlFdpMetadata(HttpServletRequest request) throws
             FairMetadataServiceException, ResourceNotFoundException,
             MetadataException {
-        ModelAndView mav = new ModelAndView("repository");
         LOGGER.info("Request to get FDP metadata");
-        LOGGER.info("GET : " + request.getRequestURL());
         String uri = getRequesedURL(request);
-        if (!isFDPMetaDataAvailable) {
-            storeDefaultFDPMetadata(request);
-        }
+        LOGGER.info("GET : {}", uri);
+        ensureDefaultFDPMetadata(request);
         FDPMetadata metadata = fairMetaDataService.retrieveFDPMetaData(
                 valueFactory.createIRI(uri));
-        mav.addObject("metadata", metadata);
-        mav.addObject("jsonLd", MetadataUtils.getString(metadata,
-                RDFFormat.JSONLD));
-        return mav;
+        return createHtmlMetadataView("repository", metadata);
     }
 
     /**
@@ -171,9 +164,9 @@ public class MetadataController {
             @PathVariable final String id, HttpServletRequest request,
             HttpServletResponse response) throws FairMetadataServiceException,
             ResourceNotFoundException {
-        LOGGER.info("Request to get CATALOG metadata with ID ", id);
-        LOGGER.info("GET : " + request.getRequestURL());
+        LOGGER.info("Request to get CATALOG metadata with ID {}", id);
         String uri = getRequesedURL(request);
+        LOGGER.info("GET : {}", uri);
         CatalogMetadata metadata = fairMetaDataService.
                 retrieveCatalogMetaData(valueFactory.createIRI(uri));
         LoggerUtils.logRequest(LOGGER, request, response);
@@ -186,14 +179,10 @@ public class MetadataController {
     public ModelAndView getHtmlCatalogMetadata(HttpServletRequest request)
             throws FairMetadataServiceException, ResourceNotFoundException,
             MetadataException {
-        ModelAndView mav = new ModelAndView("catalog");
         String uri = getRequesedURL(request);
         CatalogMetadata metadata = fairMetaDataService.
                 retrieveCatalogMetaData(valueFactory.createIRI(uri));
-        mav.addObject("metadata", metadata);
-        mav.addObject("jsonLd", MetadataUtils.getString(metadata,
-                RDFFormat.JSONLD));
-        return mav;
+        return createHtmlMetadataView("catalog", metadata);
     }
 
     /**
@@ -218,9 +207,9 @@ public class MetadataController {
             @PathVariable final String id, HttpServletRequest request,
             HttpServletResponse response) throws FairMetadataServiceException,
             ResourceNotFoundException {
-        LOGGER.info("Request to get DATASET metadata with ID ", id);
-        LOGGER.info("GET : " + request.getRequestURL());
+        LOGGER.info("Request to get DATASET metadata with ID {}", id);
         String uri = getRequesedURL(request);
+        LOGGER.info("GET : {}", uri);
         DatasetMetadata metadata = fairMetaDataService.
                 retrieveDatasetMetaData(valueFactory.createIRI(uri));
         LoggerUtils.logRequest(LOGGER, request, response);
@@ -233,14 +222,10 @@ public class MetadataController {
     public ModelAndView getHtmlDatsetMetadata(HttpServletRequest request)
             throws FairMetadataServiceException, ResourceNotFoundException,
             MetadataException {
-        ModelAndView mav = new ModelAndView("dataset");
         String uri = getRequesedURL(request);
         DatasetMetadata metadata = fairMetaDataService.
                 retrieveDatasetMetaData(valueFactory.createIRI(uri));
-        mav.addObject("metadata", metadata);
-        mav.addObject("jsonLd", MetadataUtils.getString(metadata,
-                RDFFormat.JSONLD));
-        return mav;
+        return createHtmlMetadataView("dataset", metadata);
     }
 
     /**
@@ -265,10 +250,10 @@ public class MetadataController {
             HttpServletRequest request,
             HttpServletResponse response) throws FairMetadataServiceException,
             ResourceNotFoundException {
-        LOGGER.info("Request to get dataset's distribution wih ID ",
+        LOGGER.info("Request to get dataset's distribution wih ID {}",
                 id);
-        LOGGER.info("GET : " + request.getRequestURL());
         String uri = getRequesedURL(request);
+        LOGGER.info("GET : {}", uri);
         DistributionMetadata metadata = fairMetaDataService.
                 retrieveDistributionMetaData(valueFactory.createIRI(uri));
         LoggerUtils.logRequest(LOGGER, request, response);
@@ -281,14 +266,10 @@ public class MetadataController {
     public ModelAndView getHtmlDistributionMetadata(HttpServletRequest request)
             throws FairMetadataServiceException, ResourceNotFoundException,
             MetadataException {
-        ModelAndView mav = new ModelAndView("distribution");
         String uri = getRequesedURL(request);
         DistributionMetadata metadata = fairMetaDataService.
                 retrieveDistributionMetaData(valueFactory.createIRI(uri));
-        mav.addObject("metadata", metadata);
-        mav.addObject("jsonLd", MetadataUtils.getString(metadata,
-                RDFFormat.JSONLD));
-        return mav;
+        return createHtmlMetadataView("distribution", metadata);
     }
 
     /**
@@ -308,9 +289,7 @@ public class MetadataController {
             HttpServletResponse response,
             @RequestBody(required = true) FDPMetadata metadata) throws
             FairMetadataServiceException, MetadataException {
-        if (!isFDPMetaDataAvailable) {
-            storeDefaultFDPMetadata(request);
-        }
+        ensureDefaultFDPMetadata(request);
         String uri = getRequesedURL(request);
         fairMetaDataService.updateFDPMetaData(valueFactory.createIRI(uri),
                 metadata);
@@ -338,17 +317,15 @@ public class MetadataController {
             @RequestParam("id") String id) throws
             FairMetadataServiceException, MetadataException {
         String trimmedId = trimmer(id);
-        LOGGER.info("Request to store catalog metatdata with ID ", trimmedId);
-        if (!isFDPMetaDataAvailable) {
-            storeDefaultFDPMetadata(request);
-        }
+        LOGGER.info("Request to store catalog metatdata with ID {}", trimmedId);
+        ensureDefaultFDPMetadata(request);
         String requestedURL = getRequesedURL(request);
         IRI uri = valueFactory.createIRI(requestedURL + "/" + trimmedId);
         metadata.setUri(uri);
         if (metadata.getParentURI() == null) {
             String fURI = requestedURL.replace("/catalog", "");
             LOGGER.info("No fdp uri is provied in the post body. "
-                    + "Default fdp uri is used <%s>", fURI);
+                    + "Default fdp uri is used <{}>", fURI);
             IRI fdpURI = valueFactory.createIRI(fURI);
             metadata.setParentURI(fdpURI);
         }
@@ -379,7 +356,7 @@ public class MetadataController {
             @RequestParam("id") String id)
             throws FairMetadataServiceException, MetadataException {
         String trimmedId = trimmer(id);
-        LOGGER.info("Request to store dataset metatdata with ID ", trimmedId);
+        LOGGER.info("Request to store dataset metatdata with ID {}", trimmedId);
         String requestedURL = getRequesedURL(request);
         IRI uri = valueFactory.createIRI(requestedURL + "/" + trimmedId);
         metadata.setUri(uri);
@@ -410,7 +387,7 @@ public class MetadataController {
             @RequestParam("id") String id)
             throws FairMetadataServiceException, MetadataException {
         String trimmedId = trimmer(id);
-        LOGGER.info("Request to store distribution metatdata with ID ",
+        LOGGER.info("Request to store distribution metatdata with ID {}",
                 trimmedId);
         String requestedURL = getRequesedURL(request);
         IRI uri = valueFactory.createIRI(requestedURL + "/" + trimmedId);
@@ -420,6 +397,24 @@ public class MetadataController {
         return "Metadata is stored";
     }
 
+    /**
+     * Build the HTML view for a metadata object, embedding its JSON-LD
+     * representation for the templates.
+     *
+     * @param viewName Name of the handlebars template
+     * @param metadata Metadata object to render
+     * @return ModelAndView for the requested metadata
+     * @throws MetadataException
+     */
+    private ModelAndView createHtmlMetadataView(String viewName,
+            Metadata metadata) throws MetadataException {
+        ModelAndView mav = new ModelAndView(viewName);
+        mav.addObject("metadata", metadata);
+        mav.addObject("jsonLd", MetadataUtils.getString(metadata,
+                RDFFormat.JSONLD));
+        return mav;
+    }
+
     /**
      * Get requested URL
      *
@@ -434,6 +429,20 @@ public class MetadataController {
         return url;
     }
 
+    /**
+     * Store generic FDP metadata on the first request that needs it;
+     * subsequent calls are a plain flag check.
+     *
+     * @param request HttpServletRequest
+     * @throws MetadataParserException
+     */
+    private void ensureDefaultFDPMetadata(HttpServletRequest request)
+            throws MetadataParserException {
+        if (!isFDPMetaDataAvailable) {
+            storeDefaultFDPMetadata(request);
+        }
+    }
+
     /**
      * Create and store generic FDP metadata
      *
@@ -445,7 +454,7 @@ public class MetadataController {
         LOGGER.info("Creating generic FDP metadata");
         try {
             String fdpUrl = getRequesedURL(request);
-            String host = new URL(fdpUrl).getAuthority();
+            String host = new URI(fdpUrl).getAuthority();
             FDPMetadata metadata = new FDPMetadata();
             metadata.setUri(valueFactory.createIRI(fdpUrl));
             metadata.setTitle(valueFactory.createLiteral(("FDP of " + host),
@@ -483,7 +492,7 @@ public class MetadataController {
             metadata.setRepostoryIdentifier(repoId);
             fairMetaDataService.storeFDPMetaData(metadata);
             isFDPMetaDataAvailable = true;
-        } catch (MalformedURLException | MetadataException |
+        } catch (URISyntaxException | MetadataException |
                 FairMetadataServiceException ex) {
             throw new MetadataParserException(
                     "Error creating generic FDP meatdata " + ex.getMessage());
@@ -50,7 +50,14 @@ public abstract class AbstractMetadataMessageConverter<T extends Metadata> exten
         super(getMediaTypes(format));
         this.format = format;
     }
-    
+
+    /**
+     * @return the {@link RDFFormat} this converter supports
+     */
+    public RDFFormat getFormat() {
+        return format;
+    }
+
     /**
      * Visitor method to configure content negotiation for this converter. 
      * @param configurer {@link WebMvcConfigurerAdapter#configureContentNegotiation(ContentNegotiationConfigurer)
@@ -31,7 +31,6 @@ import com.google.common.base.Charsets;
 import com.google.common.io.CharStreams;
 import java.io.IOException;
 import java.io.InputStreamReader;
-import java.io.OutputStreamWriter;
 import java.nio.charset.StandardCharsets;
 import nl.dtl.fairmetadata4j.io.DatasetMetadataParser;
 import nl.dtl.fairmetadata4j.io.MetadataException;
@@ -90,9 +89,6 @@ public class DatasetMetadataConverter extends AbstractMetadataMessageConverter
             throw new HttpMessageNotWritableException("", e);
         }
         
-        OutputStreamWriter writer = new OutputStreamWriter(
-                outputMessage.getBody(), StandardCharsets.UTF_8);
-        writer.write(result);
-        writer.close();
+        outputMessage.getBody().write(result.getBytes(StandardCharsets.UTF_8));
     }   
 }
@@ -23,7 +23,6 @@
 package nl.dtls.fairdatapoint.api.converter;
 
 import java.io.IOException;
-import java.io.OutputStreamWriter;
 import java.nio.charset.StandardCharsets;
 
 
@@ -91,9 +90,6 @@ public class FdpMetadataConverter extends AbstractMetadataMessageConverter
             throw new HttpMessageNotWritableException("", e);
         }
         
-        OutputStreamWriter writer = new OutputStreamWriter(outputMessage.getBody(),
-                StandardCharsets.UTF_8);
-        writer.write(result);
-        writer.close();
+        outputMessage.getBody().write(result.getBytes(StandardCharsets.UTF_8));
     }
 }
@@ -28,8 +28,11 @@
 package nl.dtls.fairdatapoint.service.impl;
 
 import com.google.common.base.Preconditions;
+import com.google.common.collect.ImmutableSet;
 import java.util.ArrayList;
+import java.util.LinkedHashSet;
 import java.util.List;
+import java.util.Set;
 import javax.annotation.Nonnull;
 import javax.xml.datatype.DatatypeConfigurationException;
 import nl.dtl.fairmetadata4j.io.CatalogMetadataParser;
@@ -55,8 +58,8 @@ import nl.dtls.fairdatapoint.service.FairMetadataServiceException;
 import org.apache.logging.log4j.LogManager;
 import org.apache.logging.log4j.Logger;
 import org.eclipse.rdf4j.model.IRI;
+import org.eclipse.rdf4j.model.Literal;
 import org.eclipse.rdf4j.model.Statement;
-import org.eclipse.rdf4j.model.Value;
 import org.eclipse.rdf4j.model.ValueFactory;
 import org.eclipse.rdf4j.model.impl.SimpleValueFactory;
 import org.eclipse.rdf4j.model.vocabulary.DCTERMS;
@@ -77,15 +80,26 @@ public class FairMetaDataServiceImpl implements FairMetaDataService {
 
     private final static Logger LOGGER
             = LogManager.getLogger(FairMetaDataServiceImpl.class);
+    private final static FDPMetadataParser FDP_PARSER
+            = MetadataParserUtils.getFdpParser();
+    private final static CatalogMetadataParser CATALOG_PARSER
+            = MetadataParserUtils.getCatalogParser();
+    private final static DatasetMetadataParser DATASET_PARSER
+            = MetadataParserUtils.getDatasetParser();
+    private final static DistributionMetadataParser DISTRIBUTION_PARSER
+            = MetadataParserUtils.getDistributionParser();
+    private final static Set<IRI> REFERENCE_PREDICATES
+            = ImmutableSet.of(FDP.METADATA_IDENTIFIER, R3D.INSTITUTION,
+                    DCTERMS.PUBLISHER, R3D.REPO_IDENTIFIER);
     @Autowired
     private StoreManager storeManager;
+    private final ValueFactory valueFactory = SimpleValueFactory.getInstance();
 
     @Override
     public FDPMetadata retrieveFDPMetaData(@Nonnull IRI uri) throws
             FairMetadataServiceException, ResourceNotFoundException {
         List<Statement> statements = retrieveStatements(uri);
-        FDPMetadataParser parser = MetadataParserUtils.getFdpParser();
-        FDPMetadata metadata = parser.parse(statements, uri);
+        FDPMetadata metadata = FDP_PARSER.parse(statements, uri);
         return metadata;
     }
 
@@ -93,9 +107,7 @@ public class FairMetaDataServiceImpl implements FairMetaDataService {
     public CatalogMetadata retrieveCatalogMetaData(@Nonnull IRI uri)
             throws FairMetadataServiceException, ResourceNotFoundException {
         List<Statement> statements = retrieveStatements(uri);
-        CatalogMetadataParser parser = MetadataParserUtils.
-                getCatalogParser();
-        CatalogMetadata metadata = parser.parse(statements, uri);
+        CatalogMetadata metadata = CATALOG_PARSER.parse(statements, uri);
         return metadata;
     }
 
@@ -103,9 +115,7 @@ public class FairMetaDataServiceImpl implements FairMetaDataService {
     public DatasetMetadata retrieveDatasetMetaData(@Nonnull IRI uri)
             throws FairMetadataServiceException, ResourceNotFoundException {
         List<Statement> statements = retrieveStatements(uri);
-        DatasetMetadataParser parser = MetadataParserUtils.
-                getDatasetParser();
-        DatasetMetadata metadata = parser.parse(statements, uri);
+        DatasetMetadata metadata = DATASET_PARSER.parse(statements, uri);
         return metadata;
     }
 
@@ -113,9 +123,8 @@ public class FairMetaDataServiceImpl implements FairMetaDataService {
     public DistributionMetadata retrieveDistributionMetaData(@Nonnull IRI uri)
             throws FairMetadataServiceException, ResourceNotFoundException {
         List<Statement> statements = retrieveStatements(uri);
-        DistributionMetadataParser parser = MetadataParserUtils.
-                getDistributionParser();
-        DistributionMetadata metadata = parser.parse(statements, uri);
+        DistributionMetadata metadata = DISTRIBUTION_PARSER.parse(statements,
+                uri);
         return metadata;
     }
 
@@ -171,16 +180,24 @@ public class FairMetaDataServiceImpl implements FairMetaDataService {
                 "The metadata URI already exist in the repository. "
                 + "Please try with different ID");
         try {
+            Literal currentTime = RDFUtils.getCurrentTime();
             if (metadata instanceof FDPMetadata) {
                 if (metadata.getIssued() == null) {
-                    metadata.setIssued(RDFUtils.getCurrentTime());
+                    metadata.setIssued(currentTime);
                 }
             } else {
-                metadata.setIssued(RDFUtils.getCurrentTime());
+                metadata.setIssued(currentTime);
             }
-            metadata.setModified(RDFUtils.getCurrentTime());
-            storeManager.storeStatements(MetadataUtils.getStatements(metadata));
-            updateParentResource(metadata);
+            metadata.setModified(currentTime);
+            List<Statement> statements
+                    = new ArrayList<>(MetadataUtils.getStatements(metadata));
+            if (!(metadata instanceof FDPMetadata)) {
+                storeManager.removeStatement(metadata.getParentURI(),
+                        DCTERMS.MODIFIED, null);
+                statements.addAll(getParentUpdateStatements(metadata,
+                        currentTime));
+            }
+            storeManager.storeStatements(statements);
         } catch (StoreManagerException | DatatypeConfigurationException ex) {
             LOGGER.error("Error storing distribution metadata");
             throw (new FairMetadataServiceException(ex.getMessage()));
@@ -188,38 +205,32 @@ public class FairMetaDataServiceImpl implements FairMetaDataService {
     }
 
     /**
-     * Update properties of parent class. (E.g) dcat:Modified
+     * Build statements updating properties of the parent resource. (E.g)
+     * dcat:Modified
      *
      * @param <T>
      * @param metadata Subtype of Metadata object
+     * @param currentTime Modification time to set on the parent resource
+     * @return List of statements to store along with the metadata itself
      */
-    private <T extends Metadata> void updateParentResource(@Nonnull T metadata) 
-    {
+    private <T extends Metadata> List<Statement> getParentUpdateStatements(
+            @Nonnull T metadata, Literal currentTime) {
         Preconditions.checkNotNull(metadata,
                 "Metadata object must not be null.");
-        try {
-            ValueFactory f = SimpleValueFactory.getInstance();
-            List<Statement> stmts = new ArrayList<>();
-            if (metadata instanceof FDPMetadata) {
-                return;
-            } else if (metadata instanceof CatalogMetadata) {
-                stmts.add(f.createStatement(metadata.getParentURI(),
-                        R3D.DATA_CATALOG, metadata.getUri()));
-            } else if (metadata instanceof DatasetMetadata) {
-                stmts.add(f.createStatement(metadata.getParentURI(),
-                        DCAT.DATASET, metadata.getUri()));
-            } else if (metadata instanceof DistributionMetadata) {
-                stmts.add(f.createStatement(metadata.getParentURI(),
-                        DCAT.DISTRIBUTION, metadata.getUri()));
-            }
-            storeManager.removeStatement(metadata.getParentURI(),
-                    DCTERMS.MODIFIED, null);
-            stmts.add(f.createStatement(metadata.getParentURI(),
-                    DCTERMS.MODIFIED, RDFUtils.getCurrentTime()));
-            storeManager.storeStatements(stmts);
-        } catch (StoreManagerException | DatatypeConfigurationException ex) {
-            LOGGER.error("Error updating parent resource :" + ex.getMessage());
+        List<Statement> stmts = new ArrayList<>();
+        if (metadata instanceof CatalogMetadata) {
+            stmts.add(valueFactory.createStatement(metadata.getParentURI(),
+                    R3D.DATA_CATALOG, metadata.getUri()));
+        } else if (metadata instanceof DatasetMetadata) {
+            stmts.add(valueFactory.createStatement(metadata.getParentURI(),
+                    DCAT.DATASET, metadata.getUri()));
+        } else if (metadata instanceof DistributionMetadata) {
+            stmts.add(valueFactory.createStatement(metadata.getParentURI(),
+                    DCAT.DISTRIBUTION, metadata.getUri()));
         }
+        stmts.add(valueFactory.createStatement(metadata.getParentURI(),
+                DCTERMS.MODIFIED, currentTime));
+        return stmts;
     }
 
     private List<Statement> retrieveStatements(@Nonnull IRI uri) throws
@@ -261,25 +272,15 @@ public class FairMetaDataServiceImpl implements FairMetaDataService {
 
     private void addAddtionalResource(List<Statement> statements) throws
             StoreManagerException {
-        List<Statement> otherResources = new ArrayList<>();
+        Set<IRI> referencedURIs = new LinkedHashSet<>();
         for (Statement st : statements) {
-            IRI predicate = st.getPredicate();
-            Value object = st.getObject();
-            if (predicate.equals(FDP.METADATA_IDENTIFIER)) {
-                otherResources.addAll(storeManager.retrieveResource(
-                        (IRI) object));
-            } else if (predicate.equals(R3D.INSTITUTION)) {
-                otherResources.addAll(storeManager.retrieveResource(
-                        (IRI) object));
-            } else if (predicate.equals(DCTERMS.PUBLISHER)) {
-                otherResources.addAll(storeManager.retrieveResource(
-                        (IRI) object));
-            } else if (predicate.equals(R3D.REPO_IDENTIFIER)) {
-                otherResources.addAll(storeManager.retrieveResource(
-                        (IRI) object));
+            if (REFERENCE_PREDICATES.contains(st.getPredicate())) {
+                referencedURIs.add((IRI) st.getObject());
             }
         }
-        statements.addAll(otherResources);
+        for (IRI referencedURI : referencedURIs) {
+            statements.addAll(storeManager.retrieveResource(referencedURI));
+        }
     }
 
     @Override
@@ -330,8 +331,9 @@ public class FairMetaDataServiceImpl implements FairMetaDataService {
      * @param setter the setter method of the target object.
      */
     private <T> void setMetadataProperty(Getter<T> getter, Setter<T> setter) {
-        if (getter.get() != null) {
-            setter.set(getter.get());
+        T value = getter.get();
+        if (value != null) {
+            setter.set(value);
         }
     }
 
@@ -33,8 +33,10 @@ import com.google.common.io.Resources;
 import java.io.IOException;
 import java.io.StringReader;
 import java.net.URL;
+import java.util.HashMap;
 import java.util.Iterator;
 import java.util.List;
+import java.util.Map;
 import nl.dtl.fairmetadata4j.io.CatalogMetadataParser;
 import nl.dtl.fairmetadata4j.io.DatasetMetadataParser;
 import nl.dtl.fairmetadata4j.io.DistributionMetadataParser;
@@ -85,34 +87,50 @@ public class ExampleFilesUtils {
     public final static String TEST_SUB_URI = "http://www.dtls.nl/test";  
     public static final String VALID_TEST_FILE = "valid-test-file.ttl";
     public static final RDFFormat FILE_FORMAT = RDFFormat.TURTLE;
-    
+    private static final Map<String, String> FILE_CONTENT_CACHE =
+            new HashMap<>();
+    private static final Map<String, List<Statement>> STATEMENT_CACHE =
+            new HashMap<>();
+
     /**
-     * Method to read the content of a turtle file
-     * 
+     * Method to read the content of a turtle file. The content is read from
+     * disk only once per file and reused for subsequent calls.
+     *
      * @param fileName Turtle file name
      * @return File content as a string
      */
-    public static String getFileContentAsString(String fileName)  {        
-        String content = "";  
+    public static String getFileContentAsString(String fileName)  {
+        String content = FILE_CONTENT_CACHE.get(fileName);
+        if (content != null) {
+            return content;
+        }
+        content = "";
         try {
             URL fileURL = ExampleFilesUtils.class.getResource(fileName);
             content = Resources.toString(fileURL, Charsets.UTF_8);
+            FILE_CONTENT_CACHE.put(fileName, content);
         } catch (IOException ex) {
-            LOGGER.error("Error getting turle file",ex);          
-        }        
+            LOGGER.error("Error getting turle file",ex);
+        }
         return content;
-    } 
+    }
     
     /**
-     * Method to read the content of a turtle file
-     * 
+     * Method to read the content of a turtle file. Each file is parsed only
+     * once per (file, base URI) pair; callers get a fresh copy of the cached
+     * statements so they can safely modify the returned list.
+     *
      * @param fileName Turtle file name
      * @param baseURI
      * @return File content as a string
      */
-    public static List<Statement> getFileContentAsStatements(String fileName, 
-            String baseURI)  {        
-        List<Statement> statements = null;  
+    public static List<Statement> getFileContentAsStatements(String fileName,
+            String baseURI)  {
+        String cacheKey = fileName + "|" + baseURI;
+        List<Statement> statements = STATEMENT_CACHE.get(cacheKey);
+        if (statements != null) {
+            return Lists.newArrayList(statements);
+        }
         try {
             String content = getFileContentAsString(fileName);
             StringReader reader = new StringReader(content);
@@ -120,10 +138,12 @@ public class ExampleFilesUtils {
             model = Rio.parse(reader, baseURI, FILE_FORMAT);
             Iterator<Statement> it = model.iterator();
             statements =  Lists.newArrayList(it);
-        } catch (IOException | RDFParseException | 
+            STATEMENT_CACHE.put(cacheKey, statements);
+            statements = Lists.newArrayList(statements);
+        } catch (IOException | RDFParseException |
                 UnsupportedRDFormatException ex) {
-            LOGGER.error("Error getting turle file",ex);          
-        }         
+            LOGGER.error("Error getting turle file",ex);
+        }
         return statements;
     }
     